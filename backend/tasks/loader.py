@@ -11,9 +11,12 @@ Tier 2 module: imports from ``backend.tasks.schemas`` (Tier 1) + stdlib.
 from __future__ import annotations
 
 import json
+import os
 import re
+import stat
 import warnings
 from dataclasses import dataclass
+from enum import StrEnum
 from pathlib import Path
 
 from pydantic import ValidationError
@@ -35,6 +38,7 @@ from backend.tasks.schemas import (
 
 # Task ID character rule: lowercase alphanumeric + internal hyphens, min 2 chars.
 # Appears in API URL paths, student profile references, and directory names.
+# Checked with ``fullmatch`` — ``$`` alone would also accept a trailing newline.
 _TASK_ID_RE = re.compile(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$")
 
 
@@ -43,6 +47,21 @@ _TASK_ID_RE = re.compile(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$")
 # ---------------------------------------------------------------------------
 
 
+class LoadErrorType(StrEnum):
+    """Category of a fatal ``LoadError``.
+
+    A ``StrEnum``, so members compare equal to (and log as) their plain
+    string values — existing ``error_type == "..."`` callers keep working.
+    """
+
+    MISSING_FILE = "missing_file"
+    INVALID_JSON = "invalid_json"
+    VALIDATION_ERROR = "validation_error"
+    PATH_MISMATCH = "path_mismatch"
+    INVALID_TASK_ID = "invalid_task_id"
+    PATH_TRAVERSAL = "path_traversal"
+
+
 class LoadError(Exception):
     """Fatal loading failure for a single task.
 
@@ -52,15 +71,15 @@ class LoadError(Exception):
 
     Attributes:
         task_dir: The directory that was being loaded (as string).
-        error_type: One of ``"missing_file"``, ``"invalid_json"``,
-            ``"validation_error"``, ``"path_mismatch"``, ``"invalid_task_id"``,
-            ``"path_traversal"``.
+        error_type: A ``LoadErrorType`` member (plain strings are coerced).
         message: Human-readable error description.
     """
 
-    def __init__(self, task_dir: str, error_type: str, message: str) -> None:
+    def __init__(
+        self, task_dir: str, error_type: LoadErrorType | str, message: str,
+    ) -> None:
         self.task_dir = task_dir
-        self.error_type = error_type
+        self.error_type = LoadErrorType(error_type)
         self.message = message
         super().__init__(message)
 
@@ -97,16 +116,24 @@ class LoadResult:
 # Business validation — prompt injection patterns
 # ---------------------------------------------------------------------------
 
-_INJECTION_PATTERNS: list[tuple[re.Pattern[str], str]] = [
-    (re.compile(r"<<SYS>>|<</SYS>>", re.IGNORECASE), "system prompt marker (<<SYS>>)"),
-    (re.compile(r"\[INST\]|\[/INST\]", re.IGNORECASE), "instruction marker ([INST])"),
-    (re.compile(r"\bYou are now\b", re.IGNORECASE), "role-switching (You are now)"),
-    (re.compile(r"\bIgnore previous instructions\b", re.IGNORECASE), "instruction override"),
-    (re.compile(r"\bSystem:\s", re.IGNORECASE), "role marker (System:)"),
-    (re.compile(r"\bAssistant:\s", re.IGNORECASE), "role marker (Assistant:)"),
-    (re.compile(r"\bDAN\b"), "DAN jailbreak pattern"),
+# (group name, regex source, description). Case-insensitive patterns carry
+# a scoped ``(?i:...)`` flag so all of them fit into one alternation.
+_INJECTION_PATTERNS: list[tuple[str, str, str]] = [
+    ("sys", r"(?i:<<SYS>>|<</SYS>>)", "system prompt marker (<<SYS>>)"),
+    ("inst", r"(?i:\[INST\]|\[/INST\])", "instruction marker ([INST])"),
+    ("you_are_now", r"(?i:\bYou are now\b)", "role-switching (You are now)"),
+    ("ignore", r"(?i:\bIgnore previous instructions\b)", "instruction override"),
+    ("system_role", r"(?i:\bSystem:\s)", "role marker (System:)"),
+    ("assistant_role", r"(?i:\bAssistant:\s)", "role marker (Assistant:)"),
+    ("dan", r"\bDAN\b", "DAN jailbreak pattern"),
 ]
 
+# Single compiled alternation — each text is scanned once, and the named
+# group of every hit (``m.lastgroup``) identifies which pattern matched.
+_INJECTION_RE = re.compile("|".join(
+    f"(?P<{name}>{source})" for name, source, _ in _INJECTION_PATTERNS
+))
+
 # Warning types that trigger status demotion from active to draft.
 _DEMOTION_WARNING_TYPES = frozenset({
     "orphan_phase",
@@ -282,6 +309,83 @@ def _validate_graph(
     return warn, demote
 
 
+def _check_asset_path(asset_path: str, block_id: str, dir_str: str) -> None:
+    """Rejects unsafe asset paths lexically, before any filesystem access.
+
+    Raises LoadError for ``..`` segments, absolute paths, and NUL bytes
+    (Framework P13). Pure string checks — no ``stat`` or ``resolve``.
+    """
+    if ".." in asset_path:
+        raise LoadError(
+            task_dir=dir_str,
+            error_type=LoadErrorType.PATH_TRAVERSAL,
+            message=(
+                f"Asset path '{asset_path}' in block '{block_id}' "
+                f"contains '..' — possible directory traversal"
+            ),
+        )
+    if asset_path.startswith("/"):
+        raise LoadError(
+            task_dir=dir_str,
+            error_type=LoadErrorType.PATH_TRAVERSAL,
+            message=(
+                f"Asset path '{asset_path}' in block '{block_id}' "
+                f"is absolute — must be relative to assets directory"
+            ),
+        )
+    if "\x00" in asset_path:
+        raise LoadError(
+            task_dir=dir_str,
+            error_type=LoadErrorType.PATH_TRAVERSAL,
+            message=(
+                f"Asset path {asset_path!r} in block '{block_id}' "
+                f"contains a NUL byte"
+            ),
+        )
+
+
+def _list_assets(assets_dir: Path) -> frozenset[str]:
+    """Returns the relative path of every file and directory under ``assets_dir``.
+
+    Built with a single ``os.walk`` so exact-match asset existence checks
+    become set lookups instead of one ``stat`` per referenced asset. Empty
+    when the directory does not exist.
+    """
+    entries: set[str] = set()
+    for root, dirs, files in os.walk(assets_dir):
+        rel_root = os.path.relpath(root, assets_dir)
+        for name in dirs + files:
+            entries.add(os.path.normpath(os.path.join(rel_root, name)))
+    return frozenset(entries)
+
+
+def _reject_symlinked_asset(
+    root: str, normalized: str, asset_path: str, block_id: str, dir_str: str,
+) -> None:
+    """Raises LoadError if any component of an asset path is a symlink.
+
+    ``os.lstat`` on each unresolved component catches links to files or
+    directories outside the assets directory before ``realpath`` or a later
+    reader could silently follow them (Framework P13).
+    """
+    current = root
+    for part in normalized.split(os.sep):
+        current = os.path.join(current, part)
+        try:
+            mode = os.lstat(current).st_mode
+        except OSError:
+            return  # Missing component — the existence check reports it
+        if stat.S_ISLNK(mode):
+            raise LoadError(
+                task_dir=dir_str,
+                error_type=LoadErrorType.PATH_TRAVERSAL,
+                message=(
+                    f"Asset path '{asset_path}' in block '{block_id}' "
+                    f"goes through a symlink — symlinked assets are rejected"
+                ),
+            )
+
+
 def _validate_assets(
     cartridge: TaskCartridge,
     task_dir: Path,
@@ -297,6 +401,9 @@ def _validate_assets(
     demote = False
     assets_dir = task_dir / "assets"
     dir_str = str(task_dir)
+    # Both computed once, on the first asset reference
+    root_resolved: str | None = None
+    present: frozenset[str] = frozenset()
 
     for block in cartridge.presentation_blocks:
         # Extract (block_id, asset_path) pairs from known block types
@@ -310,39 +417,38 @@ def _validate_assets(
 
         for block_id, asset_path in asset_refs:
             # Path safety — hard errors (Framework P13)
-            if ".." in asset_path:
-                raise LoadError(
-                    task_dir=dir_str,
-                    error_type="path_traversal",
-                    message=(
-                        f"Asset path '{asset_path}' in block '{block_id}' "
-                        f"contains '..' — possible directory traversal"
-                    ),
-                )
-            if asset_path.startswith("/"):
-                raise LoadError(
-                    task_dir=dir_str,
-                    error_type="path_traversal",
-                    message=(
-                        f"Asset path '{asset_path}' in block '{block_id}' "
-                        f"is absolute — must be relative to assets directory"
-                    ),
-                )
-
-            # Defense in depth: resolve and check containment
-            resolved = (assets_dir / asset_path).resolve()
-            if not resolved.is_relative_to(assets_dir.resolve()):
+            _check_asset_path(asset_path, block_id, dir_str)
+
+            if root_resolved is None:
+                root_resolved = os.path.realpath(assets_dir)
+                present = _list_assets(assets_dir)
+
+            # Defense in depth: containment against the root canonicalized
+            # once per task — a pure string check per asset
+            resolved = os.path.normpath(os.path.join(root_resolved, asset_path))
+            if not (
+                resolved == root_resolved
+                or resolved.startswith(root_resolved + os.sep)
+            ):
                 raise LoadError(
                     task_dir=dir_str,
-                    error_type="path_traversal",
+                    error_type=LoadErrorType.PATH_TRAVERSAL,
                     message=(
                         f"Asset path '{asset_path}' in block '{block_id}' "
                         f"resolves outside the assets directory"
                     ),
                 )
 
-            # Existence check — demotion warning
-            if not resolved.exists():
+            # Symlink gate — lstat the unresolved path before anything follows it
+            normalized = os.path.normpath(asset_path)
+            _reject_symlinked_asset(
+                root_resolved, normalized, asset_path, block_id, dir_str,
+            )
+
+            # Existence check — demotion warning. The directory walk answers
+            # exact matches; a miss falls back to the filesystem so its rules
+            # still apply (case-insensitive names, "." for the assets dir).
+            if normalized not in present and not os.path.exists(resolved):
                 warn.append(LoadWarning(
                     task_id=cartridge.task_id,
                     warning_type="missing_asset",
@@ -454,6 +560,17 @@ def _validate_evergreen(
     return ([], False)
 
 
+def _scan_text_for_injection(text: str) -> list[str]:
+    """Returns the description of every injection pattern found in ``text``.
+
+    One entry per matching pattern, in ``_INJECTION_PATTERNS`` order.
+    """
+    found = {m.lastgroup for m in _INJECTION_RE.finditer(text)}
+    if not found:
+        return []
+    return [desc for name, _, desc in _INJECTION_PATTERNS if name in found]
+
+
 def _scan_prompt_injection(
     cartridge: TaskCartridge,
 ) -> list[LoadWarning]:
@@ -493,13 +610,12 @@ def _scan_prompt_injection(
 
     # Check all collected text against injection patterns
     for field_desc, text in texts:
-        for pattern, desc in _INJECTION_PATTERNS:
-            if pattern.search(text):
-                warn.append(LoadWarning(
-                    task_id=task_id,
-                    warning_type="prompt_injection_suspect",
-                    message=f"Possible prompt injection in {field_desc}: {desc}",
-                ))
+        for desc in _scan_text_for_injection(text):
+            warn.append(LoadWarning(
+                task_id=task_id,
+                warning_type="prompt_injection_suspect",
+                message=f"Possible prompt injection in {field_desc}: {desc}",
+            ))
 
     return warn
 
@@ -530,7 +646,7 @@ def validate_business_rules(
         demotion, the returned cartridge has status="draft".
 
     Raises:
-        LoadError: With error_type="path_traversal" for malicious asset
+        LoadError: With ``LoadErrorType.PATH_TRAVERSAL`` for malicious asset
             paths. This is a security violation, not a content quality issue.
     """
     biz_warnings: list[LoadWarning] = []
@@ -586,6 +702,35 @@ def validate_business_rules(
 # ---------------------------------------------------------------------------
 
 
+def _check_task_identity(task_id: object, task_dir: Path) -> None:
+    """Validates task ID characters and Path=Identity.
+
+    Raises:
+        LoadError: ``INVALID_TASK_ID`` for a non-string or malformed ID,
+            ``PATH_MISMATCH`` when it differs from the directory name.
+    """
+    dir_str = str(task_dir)
+    if not isinstance(task_id, str) or not _TASK_ID_RE.fullmatch(task_id):
+        raise LoadError(
+            task_dir=dir_str,
+            error_type=LoadErrorType.INVALID_TASK_ID,
+            message=(
+                f"task_id '{task_id}' contains invalid characters — "
+                f"must match {_TASK_ID_RE.pattern} "
+                f"(lowercase alphanumeric + internal hyphens, min 2 chars)"
+            ),
+        )
+    if task_id != task_dir.name:
+        raise LoadError(
+            task_dir=dir_str,
+            error_type=LoadErrorType.PATH_MISMATCH,
+            message=(
+                f"task_id '{task_id}' does not match "
+                f"directory name '{task_dir.name}'"
+            ),
+        )
+
+
 class TaskLoader:
     """Reads and validates task cartridges from disk.
 
@@ -616,10 +761,13 @@ class TaskLoader:
         """Loads and validates a single task cartridge from disk.
 
         Sequence:
-        1. Read ``task_dir / "task.json"`` and parse JSON.
-        2. If ``task_id`` is present in parsed data — validate characters and
-           Path=Identity (directory name must match).
-        3. Call ``TaskCartridge.model_validate()`` with taxonomy context.
+        1. Read ``task_dir / "task.json"`` as bytes.
+        2. Call ``TaskCartridge.model_validate_json()`` with taxonomy context
+           (JSON parsing and validation in one pydantic-core pass). On
+           failure, re-parse to report bad JSON or a bad ``task_id`` ahead
+           of the schema error.
+        3. Validate task ID characters and Path=Identity (directory name
+           must match).
         4. Collect ``TaxonomyWarning`` emissions as ``LoadWarning`` objects.
         5. Run business validation (graph, assets, type, evergreen, injection).
 
@@ -640,63 +788,49 @@ class TaskLoader:
         task_file = task_dir / "task.json"
         dir_str = str(task_dir)
 
-        # Step 1: Read and parse JSON
+        # Step 1: Read raw bytes — parsing happens inside pydantic-core
         try:
-            with open(task_file, encoding="utf-8") as f:
-                data = json.load(f)
+            raw = task_file.read_bytes()
         except FileNotFoundError:
             raise LoadError(
                 task_dir=dir_str,
-                error_type="missing_file",
+                error_type=LoadErrorType.MISSING_FILE,
                 message=f"No task.json found in {dir_str}",
             )
-        except json.JSONDecodeError as exc:
-            raise LoadError(
-                task_dir=dir_str,
-                error_type="invalid_json",
-                message=f"Invalid JSON in {task_file}: {exc}",
-            )
-
-        # Step 2: Pre-validation checks on task_id (if present)
-        # Guard: if JSON parsed as non-dict, skip pre-checks and let Pydantic report it.
-        task_id = data.get("task_id") if isinstance(data, dict) else None
-        if task_id is not None:
-            if not isinstance(task_id, str) or not _TASK_ID_RE.match(task_id):
-                raise LoadError(
-                    task_dir=dir_str,
-                    error_type="invalid_task_id",
-                    message=(
-                        f"task_id '{task_id}' contains invalid characters — "
-                        f"must match {_TASK_ID_RE.pattern} "
-                        f"(lowercase alphanumeric + internal hyphens, min 2 chars)"
-                    ),
-                )
-            if task_id != task_dir.name:
-                raise LoadError(
-                    task_dir=dir_str,
-                    error_type="path_mismatch",
-                    message=(
-                        f"task_id '{task_id}' does not match "
-                        f"directory name '{task_dir.name}'"
-                    ),
-                )
 
-        # Step 3: Schema validation with taxonomy context injection
-        # Capture TaxonomyWarning emissions during model_validate()
+        # Step 2: Single-pass parse + schema validation with taxonomy context
+        # Capture TaxonomyWarning emissions during model_validate_json()
         load_warnings: list[LoadWarning] = []
         try:
             with warnings.catch_warnings(record=True) as caught:
                 warnings.simplefilter("always")
-                cartridge = TaskCartridge.model_validate(
-                    data, context={"taxonomy": taxonomy},
+                cartridge = TaskCartridge.model_validate_json(
+                    raw, context={"taxonomy": taxonomy},
                 )
         except ValidationError as exc:
+            # Cold path: re-parse with json to report the most specific
+            # failure — bad JSON (or non-UTF-8 bytes), then bad task_id,
+            # then the schema error.
+            try:
+                data = json.loads(raw.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as json_exc:
+                raise LoadError(
+                    task_dir=dir_str,
+                    error_type=LoadErrorType.INVALID_JSON,
+                    message=f"Invalid JSON in {task_file}: {json_exc}",
+                )
+            # Non-dict JSON skips the ID checks — Pydantic's error covers it.
+            if isinstance(data, dict) and "task_id" in data:
+                _check_task_identity(data["task_id"], task_dir)
             raise LoadError(
                 task_dir=dir_str,
-                error_type="validation_error",
+                error_type=LoadErrorType.VALIDATION_ERROR,
                 message=f"Schema validation failed for {dir_str}: {exc}",
             )
 
+        # Step 3: Task ID characters and Path=Identity
+        _check_task_identity(cartridge.task_id, task_dir)
+
         # Step 4: Convert captured TaxonomyWarning into LoadWarning objects
         for w in caught:
             if issubclass(w.category, TaxonomyWarning):
@@ -722,9 +856,9 @@ class TaskLoader:
     ) -> tuple[list[LoadResult], list[LoadError]]:
         """Scans ``content_dir / "tasks"`` and loads all task cartridges.
 
-        Iterates child directories of the tasks folder, skipping non-directories
-        and directories that don't contain ``task.json``.  Never raises — all
-        errors are collected and returned.
+        Iterates child directories of the tasks folder in name order, skipping
+        non-directories and directories that don't contain ``task.json``.
+        Never raises — all errors are collected and returned.
 
         Args:
             content_dir: The content root (e.g. ``content/``).
@@ -741,9 +875,18 @@ class TaskLoader:
         successes: list[LoadResult] = []
         errors: list[LoadError] = []
 
-        for child in sorted(tasks_dir.iterdir()):
-            if not child.is_dir():
-                continue
+        # Serial on purpose: load_task collects TaxonomyWarning through
+        # warnings.catch_warnings(), which swaps process-global state and
+        # would misattribute warnings across concurrent loads. scandir
+        # reports entry types from the directory listing itself.
+        with os.scandir(tasks_dir) as it:
+            entries = sorted(
+                (entry for entry in it if entry.is_dir()),
+                key=lambda entry: entry.name,
+            )
+
+        for entry in entries:
+            child = Path(entry.path)
             if not (child / "task.json").exists():
                 continue
             try:
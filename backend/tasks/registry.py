@@ -27,12 +27,15 @@ class TaskRegistry:
     Args:
         content_dir: Path to the content directory (contains tasks/).
         taxonomy_path: Path to taxonomy.json (typically content_dir / "taxonomy.json").
+        loader: Reads and validates cartridges. Defaults to a new ``TaskLoader``.
     """
 
-    def __init__(self, content_dir: Path, taxonomy_path: Path) -> None:
+    def __init__(
+        self, content_dir: Path, taxonomy_path: Path, loader: TaskLoader | None = None,
+    ) -> None:
         self._content_dir = content_dir
         self._taxonomy_path = taxonomy_path
-        self._loader = TaskLoader()
+        self._loader = loader if loader is not None else TaskLoader()
 
         # Indexes — populated by load()/reload()
         self._by_id: dict[str, TaskCartridge] = {}
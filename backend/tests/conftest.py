@@ -9,20 +9,32 @@ Fixtures:
     make_cartridge: Factory for valid AI-capable TaskCartridge instances
     mock_registry: Pre-populated TaskRegistry with one default cartridge
     patch_provider: Patches create_provider to return a given mock provider
+    _isolate_telemetry: Autouse; redirects session telemetry to a temp dir
 
 Helpers (imported directly by test modules):
     write_prompt_file: Creates a prompt file at the given path
     setup_base_prompts: Creates the three mandatory base prompt files
+    dumps_json: Serializes data to UTF-8 JSON bytes for fixture files
+    build_static_cartridge_data: Builds the smallest valid static cartridge dict
+    write_task_json: Writes a cartridge dict to content/tasks/{task_id}/task.json
+    load_in_memory: Schema + business validation of a static cartridge, no disk I/O
+
+Constants (imported directly by test modules):
+    TAXONOMY: Read-only test taxonomy for loader and registry tests
 """
 
+import json
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from uuid import uuid4
 
 import pytest
 
 from backend.ai.providers.mock import MockProvider
 from backend.schemas import GameSession
+from backend.tasks.loader import LoadResult, validate_business_rules
 from backend.tasks.registry import TaskRegistry
 from backend.tasks.schemas import TaskCartridge
 
@@ -66,6 +78,160 @@ def setup_base_prompts(prompts_dir: Path) -> None:
     write_prompt_file(trickster / "safety_base.md", "Test safety content.")
 
 
+# ---------------------------------------------------------------------------
+# Shared task-fixture helpers (plain functions, not fixtures)
+# ---------------------------------------------------------------------------
+
+
+# Read-only at both levels — shared by every test, so none may mutate it.
+TAXONOMY: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "triggers": MappingProxyType({
+        "urgency": "Skubumas", "belonging": "Priklausymas",
+    }),
+    "techniques": MappingProxyType({
+        "headline_manipulation": "Antraštės manipuliacija",
+        "manufactured_deadline": "Dirbtinis terminas",
+        "cherry_picking": "Selektyvus citavimas",
+    }),
+    "mediums": MappingProxyType({
+        "article": "Straipsnis", "social_post": "Socialinis įrašas",
+    }),
+})
+
+
+def dumps_json(data: object) -> bytes:
+    """Serializes ``data`` to UTF-8 JSON bytes (non-ASCII kept as-is)."""
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def build_static_cartridge_data(task_id: str) -> dict:
+    """Builds the smallest valid static cartridge dict.
+
+    Two phases (button intro -> terminal reveal), one pattern, one checklist
+    item — passes every validation layer without ai_config, prompt
+    directories or assets. Uses only ``TAXONOMY`` values.
+    """
+    return {
+        "task_id": task_id,
+        "task_type": "static",
+        "title": "Testas",
+        "description": "Testo aprašymas",
+        "version": "1.0",
+        "trigger": "urgency",
+        "technique": "headline_manipulation",
+        "medium": "article",
+        "learning_objectives": ["Atpažinti manipuliaciją"],
+        "difficulty": 3,
+        "time_minutes": 15,
+        "is_evergreen": True,
+        "is_clean": False,
+        "initial_phase": "phase_intro",
+        "phases": [
+            {
+                "id": "phase_intro",
+                "title": "Įvadas",
+                "is_ai_phase": False,
+                "interaction": {
+                    "type": "button",
+                    "choices": [
+                        {"label": "Tęsti", "target_phase": "phase_reveal"},
+                    ],
+                },
+            },
+            {
+                "id": "phase_reveal",
+                "title": "Atskleidimas",
+                "is_terminal": True,
+                "evaluation_outcome": "trickster_loses",
+            },
+        ],
+        "evaluation": {
+            "patterns_embedded": [
+                {
+                    "id": "p1",
+                    "description": "Urgency pattern",
+                    "technique": "manufactured_deadline",
+                    "real_world_connection": "Common in news",
+                },
+            ],
+            "checklist": [
+                {
+                    "id": "c1",
+                    "description": "Identified urgency",
+                    "pattern_refs": ["p1"],
+                    "is_mandatory": True,
+                },
+            ],
+            "pass_conditions": {
+                "trickster_wins": "Mokinys pasidalino",
+                "partial": "Mokinys perskaitė, bet praleido",
+                "trickster_loses": "Mokinys atpažino technikas",
+            },
+        },
+        "reveal": {"key_lesson": "Antraštė buvo sukurta skubos jausmui sukelti"},
+        "safety": {
+            "content_boundaries": ["no_real_harm"],
+            "intensity_ceiling": 3,
+            "cold_start_safe": True,
+        },
+    }
+
+
+def write_task_json(content_dir: Path, task_id: str, data: dict) -> Path:
+    """Writes ``data`` to ``content_dir/tasks/{task_id}/task.json``.
+
+    Returns the task directory path.
+    """
+    task_dir = content_dir / "tasks" / task_id
+    task_dir.mkdir(parents=True)
+    (task_dir / "task.json").write_bytes(dumps_json(data))
+    return task_dir
+
+
+# Project root for in-memory validation — never created on disk.
+_NO_PROJECT_ROOT = Path("/nonexistent-project-root")
+
+
+def load_in_memory(task_id: str, overrides: dict | None = None) -> LoadResult:
+    """Runs schema + business validation on a cartridge dict without disk I/O.
+
+    Starts from ``build_static_cartridge_data(task_id)`` with top-level
+    ``overrides`` applied. For rules that only inspect the cartridge itself
+    (type completeness, evergreen, prompt injection). No assets are
+    referenced, and the project root does not exist, so the prompt directory
+    check only warns.
+    """
+    data = build_static_cartridge_data(task_id)
+    if overrides:
+        data.update(overrides)
+    cartridge = TaskCartridge.model_validate(data, context={"taxonomy": TAXONOMY})
+    cartridge, biz_warnings = validate_business_rules(
+        cartridge, Path("tasks") / task_id, _NO_PROJECT_ROOT,
+    )
+    return LoadResult(cartridge=cartridge, warnings=biz_warnings)
+
+
+# ---------------------------------------------------------------------------
+# Session telemetry isolation
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolate_telemetry(tmp_path_factory: pytest.TempPathFactory):
+    """Redirects ``backend.telemetry.DATA_DIR`` to a temp dir for the whole run.
+
+    API tests that start, finish or end sessions write telemetry files as a
+    side effect — without this they pile up in the repo's data/sessions/.
+    """
+    import backend.telemetry
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            backend.telemetry, "DATA_DIR", tmp_path_factory.mktemp("sessions"),
+        )
+        yield
+
+
 # ---------------------------------------------------------------------------
 # MockProvider factory
 # ---------------------------------------------------------------------------
@@ -0,0 +1,77 @@
+"""Micro-benchmarks for the backend.tasks.loader hot path.
+
+Skipped unless pytest-benchmark is installed (backend/requirements-dev.txt);
+pass ``--benchmark-skip`` to leave them out of a run. Guards load_task,
+load_all_tasks and the in-memory validation layers against regressions —
+see README "Run tests" for the save/compare workflow.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from backend.tasks.loader import LoadResult, TaskLoader
+from backend.tests.conftest import (
+    TAXONOMY, build_static_cartridge_data, load_in_memory, write_task_json,
+)
+
+pytestmark = pytest.mark.benchmark
+
+_TASK_COUNT = 50
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def content_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Fifty minimal valid tasks, written once for every benchmark."""
+    content_dir = tmp_path_factory.mktemp("bench-content")
+    for i in range(_TASK_COUNT):
+        task_id = f"task-bench-{i:03d}"
+        write_task_json(content_dir, task_id, build_static_cartridge_data(task_id))
+    return content_dir
+
+
+@pytest.fixture(scope="session")
+def loader() -> TaskLoader:
+    return TaskLoader()
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+
+def test_bench_load_single(
+    benchmark, content_dir: Path, loader: TaskLoader,
+) -> None:
+    """One task: read + parse + schema + business validation."""
+    task_dir = content_dir / "tasks" / "task-bench-000"
+
+    result = benchmark(loader.load_task, task_dir, TAXONOMY, content_dir)
+
+    assert isinstance(result, LoadResult)
+
+
+def test_bench_load_all_50(
+    benchmark, content_dir: Path, loader: TaskLoader,
+) -> None:
+    """Directory scan plus fifty serial loads."""
+    successes, errors = benchmark(loader.load_all_tasks, content_dir, TAXONOMY)
+
+    assert len(successes) == _TASK_COUNT
+    assert not errors
+
+
+def test_bench_validate_only(benchmark) -> None:
+    """Schema + business validation on an in-memory dict — no disk I/O."""
+    result = benchmark(load_in_memory, "task-bench-000")
+
+    assert isinstance(result, LoadResult)
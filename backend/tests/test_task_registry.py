@@ -3,102 +3,74 @@ dependency function, and empty directory handling."""
 
 from __future__ import annotations
 
+import copy
 import json
+import os
+import shutil
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
-from backend.tasks.loader import LoadError, LoadWarning
+from backend.tasks.loader import (
+    LoadError, LoadResult, LoadWarning, TaskLoader, validate_business_rules,
+)
 from backend.tasks.registry import TaskRegistry
 from backend.tasks.schemas import TaskCartridge
+from backend.tests.conftest import TAXONOMY, build_static_cartridge_data, dumps_json
 
 
 # ---------------------------------------------------------------------------
-# Test taxonomy
+# Helpers
 # ---------------------------------------------------------------------------
 
-TAXONOMY: dict = {
-    "triggers": {"urgency": "Skubumas", "belonging": "Priklausymas"},
-    "techniques": {
-        "headline_manipulation": "Antraštės manipuliacija",
-        "manufactured_deadline": "Dirbtinis terminas",
-        "cherry_picking": "Selektyvus citavimas",
-    },
-    "mediums": {"article": "Straipsnis", "social_post": "Socialinis įrašas"},
+
+# The smallest valid cartridge — passes all validation layers. Built once at
+# import; ``_minimal_cartridge`` deep-copies it per call.
+_TASK_ID_TOKEN = "__task_id__"
+_TEMPLATE: dict = build_static_cartridge_data(_TASK_ID_TOKEN)
+
+
+# ``_TEMPLATE`` encoded once — ``_write_task`` without overrides only swaps
+# the quoted placeholder for the real ID instead of re-serializing.
+_TEMPLATE_BYTES = dumps_json(_TEMPLATE)
+_TASK_ID_PLACEHOLDER = json.dumps(_TASK_ID_TOKEN).encode("utf-8")
+
+
+def _encode_member(key: str, value: object) -> bytes:
+    """Encodes one ``"key": value`` JSON object member (no braces)."""
+    return dumps_json({key: value})[1:-1]
+
+
+# Each top-level ``_TEMPLATE`` member encoded once — ``_encode_task`` only
+# encodes the overridden members and splices them in.
+_TEMPLATE_MEMBERS: dict[str, bytes] = {
+    key: _encode_member(key, value) for key, value in _TEMPLATE.items()
 }
 
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
+def _encode_task(task_id: str, overrides: dict) -> bytes:
+    """Encodes ``_TEMPLATE`` with ``task_id`` and top-level ``overrides``.
+
+    Same JSON object as ``{**_minimal_cartridge(task_id), **overrides}``.
+    """
+    members = dict(_TEMPLATE_MEMBERS)
+    for key, value in {"task_id": task_id, **overrides}.items():
+        members[key] = _encode_member(key, value)
+    return b"{" + b",".join(members.values()) + b"}"
+
+
+# ``TAXONOMY`` as taxonomy.json bytes — the default ``_write_taxonomy`` payload.
+_TAXONOMY_BYTES = dumps_json({
+    category: dict(values) for category, values in TAXONOMY.items()
+})
 
 
 def _minimal_cartridge(task_id: str) -> dict:
     """Returns the smallest valid cartridge dict — passes all validation layers."""
-    return {
-        "task_id": task_id,
-        "task_type": "static",
-        "title": "Testas",
-        "description": "Testo aprašymas",
-        "version": "1.0",
-        "trigger": "urgency",
-        "technique": "headline_manipulation",
-        "medium": "article",
-        "learning_objectives": ["Atpažinti manipuliaciją"],
-        "difficulty": 3,
-        "time_minutes": 15,
-        "is_evergreen": True,
-        "is_clean": False,
-        "initial_phase": "phase_intro",
-        "phases": [
-            {
-                "id": "phase_intro",
-                "title": "Įvadas",
-                "is_ai_phase": False,
-                "interaction": {
-                    "type": "button",
-                    "choices": [
-                        {"label": "Tęsti", "target_phase": "phase_reveal"},
-                    ],
-                },
-            },
-            {
-                "id": "phase_reveal",
-                "title": "Atskleidimas",
-                "is_terminal": True,
-                "evaluation_outcome": "trickster_loses",
-            },
-        ],
-        "evaluation": {
-            "patterns_embedded": [
-                {
-                    "id": "p1",
-                    "description": "Urgency pattern",
-                    "technique": "manufactured_deadline",
-                    "real_world_connection": "Common in news",
-                },
-            ],
-            "checklist": [
-                {
-                    "id": "c1",
-                    "description": "Identified urgency",
-                    "pattern_refs": ["p1"],
-                    "is_mandatory": True,
-                },
-            ],
-            "pass_conditions": {
-                "trickster_wins": "Mokinys pasidalino",
-                "partial": "Mokinys perskaitė, bet praleido",
-                "trickster_loses": "Mokinys atpažino technikas",
-            },
-        },
-        "reveal": {"key_lesson": "Antraštė buvo sukurta skubos jausmui sukelti"},
-        "safety": {
-            "content_boundaries": ["no_real_harm"],
-            "intensity_ceiling": 3,
-            "cold_start_safe": True,
-        },
-    }
+    data = copy.deepcopy(_TEMPLATE)
+    data["task_id"] = task_id
+    return data
 
 
 def _write_task(
@@ -109,29 +81,146 @@ def _write_task(
     Uses tmp_path as content_dir (tasks/ subdir created inside it).
     Returns the task directory path.
     """
-    task_dir = tmp_path / "tasks" / task_id
-    task_dir.mkdir(parents=True)
-    data = _minimal_cartridge(task_id)
+    tasks_root = tmp_path / "tasks"
+    os.makedirs(tasks_root, exist_ok=True)
+    task_dir = tasks_root / task_id
+    os.mkdir(task_dir)
     if overrides:
-        data.update(overrides)
-    (task_dir / "task.json").write_text(
-        json.dumps(data, ensure_ascii=False), encoding="utf-8",
-    )
+        payload = _encode_task(task_id, overrides)
+    else:
+        payload = _TEMPLATE_BYTES.replace(
+            _TASK_ID_PLACEHOLDER, json.dumps(task_id).encode("utf-8"),
+        )
+    (task_dir / "task.json").write_bytes(payload)
     return task_dir
 
 
 def _write_taxonomy(tmp_path: Path, taxonomy: dict | None = None) -> Path:
-    """Writes taxonomy.json to tmp_path and returns the path."""
-    tax = taxonomy or TAXONOMY
+    """Writes taxonomy.json to tmp_path and returns the path.
+
+    Without ``taxonomy``, writes the pre-encoded ``TAXONOMY`` bytes.
+    """
     tax_path = tmp_path / "taxonomy.json"
-    tax_path.write_text(json.dumps(tax, ensure_ascii=False), encoding="utf-8")
+    tax_path.write_bytes(dumps_json(taxonomy) if taxonomy else _TAXONOMY_BYTES)
     return tax_path
 
 
-def _make_registry(tmp_path: Path) -> TaskRegistry:
+def _make_registry(tmp_path: Path, loader: TaskLoader | None = None) -> TaskRegistry:
     """Creates a TaskRegistry pointing at tmp_path as content_dir."""
     tax_path = _write_taxonomy(tmp_path)
-    return TaskRegistry(content_dir=tmp_path, taxonomy_path=tax_path)
+    return TaskRegistry(content_dir=tmp_path, taxonomy_path=tax_path, loader=loader)
+
+
+# Fixed task superset behind ``shared_registry``. Listed in non-alphabetical
+# order so sorting assertions mean something. Active tasks:
+#
+#   task id   trigger    technique              medium       diff  tags
+#   task-zz   belonging  headline_manipulation  social_post  5     —
+#   task-aa   urgency    headline_manipulation  article      1     beginner, visual
+#   task-mm   belonging  cherry_picking         article      3     advanced, visual
+#
+# Plus task-draft (draft), task-dep (deprecated) and task-demoted (declared
+# active, demoted to draft by is_evergreen=False).
+_SHARED_TASKS: list[tuple[str, dict]] = [
+    ("task-zz", {
+        "trigger": "belonging", "medium": "social_post", "difficulty": 5,
+    }),
+    ("task-aa", {"difficulty": 1, "tags": ["beginner", "visual"]}),
+    ("task-mm", {
+        "trigger": "belonging", "technique": "cherry_picking",
+        "tags": ["advanced", "visual"],
+    }),
+    ("task-draft", {"status": "draft"}),
+    ("task-dep", {"status": "deprecated"}),
+    ("task-demoted", {"is_evergreen": False}),
+]
+_SHARED_ACTIVE = ["task-aa", "task-mm", "task-zz"]
+
+
+# Content root for in-memory registries — never created on disk.
+_NO_CONTENT_DIR = Path("/nonexistent-content")
+
+
+class _InMemoryLoader:
+    """Stands in for ``TaskLoader`` — serves pre-built results, no disk I/O."""
+
+    def __init__(self, results: list[LoadResult]) -> None:
+        self._results = results
+
+    def load_taxonomy(self, taxonomy_path: Path) -> dict:
+        return TAXONOMY
+
+    def load_all_tasks(
+        self, content_dir: Path, taxonomy: dict,
+    ) -> tuple[list[LoadResult], list[LoadError]]:
+        return list(self._results), []
+
+
+# ``_TEMPLATE`` validated once — variants are ``model_copy`` updates of it.
+_BASE_CARTRIDGE = TaskCartridge.model_validate(
+    _TEMPLATE, context={"taxonomy": TAXONOMY},
+)
+
+
+def _make_cartridge(task_id: str, **overrides: object) -> TaskCartridge:
+    """Returns a copy of ``_BASE_CARTRIDGE`` with ``task_id`` and ``overrides``.
+
+    ``model_copy`` skips validation — overrides must be valid field values.
+    """
+    return _BASE_CARTRIDGE.model_copy(update={"task_id": task_id, **overrides})
+
+
+def _load_result(task_id: str, overrides: dict | None = None) -> LoadResult:
+    """Business validation of a cached cartridge variant, without disk I/O.
+
+    Runs the same business rules as ``TaskLoader.load_task`` (demotion
+    included); schema validation was paid once for ``_BASE_CARTRIDGE``.
+    """
+    cartridge = _make_cartridge(task_id, **(overrides or {}))
+    cartridge, biz_warnings = validate_business_rules(
+        cartridge, _NO_CONTENT_DIR / "tasks" / task_id, _NO_CONTENT_DIR.parent,
+    )
+    return LoadResult(cartridge=cartridge, warnings=biz_warnings)
+
+
+def _make_memory_registry(results: list[LoadResult]) -> TaskRegistry:
+    """Loads a TaskRegistry from ``results`` through the real index build."""
+    registry = TaskRegistry(
+        content_dir=_NO_CONTENT_DIR,
+        taxonomy_path=_NO_CONTENT_DIR / "taxonomy.json",
+        loader=_InMemoryLoader(results),
+    )
+    registry.load()
+    return registry
+
+
+@pytest.fixture(scope="module")
+def scratch_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One scratch content dir per module, backing ``scratch``."""
+    return tmp_path_factory.mktemp("registry")
+
+
+@pytest.fixture
+def scratch(scratch_root: Path) -> Iterator[Path]:
+    """Empty content dir for tests that write their own tree.
+
+    Reuses ``scratch_root`` instead of a fresh ``tmp_path`` per test and
+    prunes what tests write (``tasks/``, ``taxonomy.json``) on teardown.
+    """
+    yield scratch_root
+    shutil.rmtree(scratch_root / "tasks", ignore_errors=True)
+    (scratch_root / "taxonomy.json").unlink(missing_ok=True)
+
+
+@pytest.fixture(scope="module")
+def shared_registry() -> TaskRegistry:
+    """One loaded registry over ``_SHARED_TASKS`` for read-only tests.
+
+    Built in memory once per module — tests must only query it, never reload.
+    """
+    return _make_memory_registry([
+        _load_result(task_id, overrides) for task_id, overrides in _SHARED_TASKS
+    ])
 
 
 # ---------------------------------------------------------------------------
@@ -142,34 +231,34 @@ def _make_registry(tmp_path: Path) -> TaskRegistry:
 class TestLoad:
     """TaskRegistry.load — initial loading and index building."""
 
-    def test_empty_dir_produces_empty_registry(self, tmp_path: Path) -> None:
-        registry = _make_registry(tmp_path)
+    def test_empty_dir_produces_empty_registry(self, scratch: Path) -> None:
+        registry = _make_registry(scratch)
         registry.load()
         assert registry.count() == 0
         assert registry.count("all") == 0
         assert registry.load_errors == []
 
-    def test_no_tasks_subdir_produces_empty_registry(self, tmp_path: Path) -> None:
-        registry = _make_registry(tmp_path)
+    def test_no_tasks_subdir_produces_empty_registry(self, scratch: Path) -> None:
+        registry = _make_registry(scratch)
         registry.load()
         assert registry.count() == 0
 
-    def test_loads_valid_tasks(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01")
-        _write_task(tmp_path, "task-02")
-        registry = _make_registry(tmp_path)
+    def test_loads_valid_tasks(self, scratch: Path) -> None:
+        _write_task(scratch, "task-01")
+        _write_task(scratch, "task-02")
+        registry = _make_registry(scratch)
         registry.load()
         assert registry.count() == 2
         assert registry.count("all") == 2
 
-    def test_mix_of_valid_and_invalid(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-good")
+    def test_mix_of_valid_and_invalid(self, scratch: Path) -> None:
+        _write_task(scratch, "task-good")
         # Create invalid cartridge
-        bad_dir = tmp_path / "tasks" / "task-bad"
+        bad_dir = scratch / "tasks" / "task-bad"
         bad_dir.mkdir(parents=True)
         (bad_dir / "task.json").write_text("{invalid json", encoding="utf-8")
 
-        registry = _make_registry(tmp_path)
+        registry = _make_registry(scratch)
         registry.load()
         assert registry.count() == 1
         assert registry.get_task("task-good") is not None
@@ -177,21 +266,21 @@ class TestLoad:
         assert len(registry.load_errors) == 1
         assert registry.load_errors[0].error_type == "invalid_json"
 
-    def test_load_errors_accessible(self, tmp_path: Path) -> None:
-        bad_dir = tmp_path / "tasks" / "task-bad"
+    def test_load_errors_accessible(self, scratch: Path) -> None:
+        bad_dir = scratch / "tasks" / "task-bad"
         bad_dir.mkdir(parents=True)
         (bad_dir / "task.json").write_text("not json!", encoding="utf-8")
 
-        registry = _make_registry(tmp_path)
+        registry = _make_registry(scratch)
         registry.load()
         errors = registry.load_errors
         assert len(errors) == 1
         assert isinstance(errors[0], LoadError)
 
-    def test_load_warnings_accessible(self, tmp_path: Path) -> None:
+    def test_load_warnings_accessible(self, scratch: Path) -> None:
         # Create a task with an unknown trigger to generate a taxonomy warning
-        _write_task(tmp_path, "task-warn", {"trigger": "unknown_trigger"})
-        registry = _make_registry(tmp_path)
+        _write_task(scratch, "task-warn", {"trigger": "unknown_trigger"})
+        registry = _make_registry(scratch)
         registry.load()
 
         warnings = registry.load_warnings
@@ -207,33 +296,22 @@ class TestLoad:
 class TestGetTask:
     """TaskRegistry.get_task — single cartridge lookup by ID."""
 
-    def test_returns_cartridge(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01")
-        registry = _make_registry(tmp_path)
-        registry.load()
-        c = registry.get_task("task-01")
+    def test_returns_cartridge(self, shared_registry: TaskRegistry) -> None:
+        c = shared_registry.get_task("task-aa")
         assert c is not None
         assert isinstance(c, TaskCartridge)
-        assert c.task_id == "task-01"
+        assert c.task_id == "task-aa"
 
-    def test_returns_none_for_unknown(self, tmp_path: Path) -> None:
-        registry = _make_registry(tmp_path)
-        registry.load()
-        assert registry.get_task("nonexistent") is None
+    def test_returns_none_for_unknown(self, shared_registry: TaskRegistry) -> None:
+        assert shared_registry.get_task("nonexistent") is None
 
-    def test_finds_draft_task(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-draft", {"status": "draft"})
-        registry = _make_registry(tmp_path)
-        registry.load()
-        c = registry.get_task("task-draft")
+    def test_finds_draft_task(self, shared_registry: TaskRegistry) -> None:
+        c = shared_registry.get_task("task-draft")
         assert c is not None
         assert c.status == "draft"
 
-    def test_finds_deprecated_task(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-dep", {"status": "deprecated"})
-        registry = _make_registry(tmp_path)
-        registry.load()
-        c = registry.get_task("task-dep")
+    def test_finds_deprecated_task(self, shared_registry: TaskRegistry) -> None:
+        c = shared_registry.get_task("task-dep")
         assert c is not None
         assert c.status == "deprecated"
 
@@ -246,104 +324,30 @@ class TestGetTask:
 class TestQuerySingleCriterion:
     """TaskRegistry.query — filtering by one criterion at a time."""
 
-    def test_filter_by_trigger(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01", {"trigger": "urgency"})
-        _write_task(tmp_path, "task-02", {"trigger": "belonging"})
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        results = registry.query(trigger="urgency")
-        assert len(results) == 1
-        assert results[0].task_id == "task-01"
-
-    def test_filter_by_technique(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01", {"technique": "headline_manipulation"})
-        _write_task(tmp_path, "task-02", {"technique": "cherry_picking"})
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        results = registry.query(technique="cherry_picking")
-        assert len(results) == 1
-        assert results[0].task_id == "task-02"
-
-    def test_filter_by_medium(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01", {"medium": "article"})
-        _write_task(tmp_path, "task-02", {"medium": "social_post"})
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        results = registry.query(medium="social_post")
-        assert len(results) == 1
-        assert results[0].task_id == "task-02"
-
-    def test_filter_by_difficulty_range(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01", {"difficulty": 1})
-        _write_task(tmp_path, "task-02", {"difficulty": 3})
-        _write_task(tmp_path, "task-03", {"difficulty": 5})
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        results = registry.query(difficulty_min=2, difficulty_max=4)
-        assert len(results) == 1
-        assert results[0].task_id == "task-02"
-
-    def test_filter_by_difficulty_min_only(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01", {"difficulty": 1})
-        _write_task(tmp_path, "task-02", {"difficulty": 4})
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        results = registry.query(difficulty_min=3)
-        assert len(results) == 1
-        assert results[0].task_id == "task-02"
-
-    def test_filter_by_difficulty_max_only(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01", {"difficulty": 2})
-        _write_task(tmp_path, "task-02", {"difficulty": 5})
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        results = registry.query(difficulty_max=3)
-        assert len(results) == 1
-        assert results[0].task_id == "task-01"
-
-    def test_filter_by_tags(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01", {"tags": ["beginner", "visual"]})
-        _write_task(tmp_path, "task-02", {"tags": ["advanced", "visual"]})
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        results = registry.query(tags=["beginner"])
-        assert len(results) == 1
-        assert results[0].task_id == "task-01"
-
-    def test_tags_use_and_logic(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01", {"tags": ["beginner", "visual"]})
-        _write_task(tmp_path, "task-02", {"tags": ["advanced", "visual"]})
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        # Both have "visual", only task-01 has "beginner"
-        results = registry.query(tags=["beginner", "visual"])
-        assert len(results) == 1
-        assert results[0].task_id == "task-01"
-
-    def test_empty_result_returns_empty_list(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01")
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        results = registry.query(trigger="nonexistent")
-        assert results == []
-
-    def test_no_filter_returns_all_active(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01")
-        _write_task(tmp_path, "task-02")
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        results = registry.query()
-        assert len(results) == 2
+    @pytest.mark.parametrize("criteria,expected_ids", [
+        ({"trigger": "urgency"}, ["task-aa"]),
+        ({"technique": "cherry_picking"}, ["task-mm"]),
+        ({"medium": "social_post"}, ["task-zz"]),
+        ({"difficulty_min": 2, "difficulty_max": 4}, ["task-mm"]),
+        ({"difficulty_min": 4}, ["task-zz"]),
+        ({"difficulty_max": 2}, ["task-aa"]),
+        ({"tags": ["beginner"]}, ["task-aa"]),
+        ({"tags": ["visual"]}, ["task-aa", "task-mm"]),
+        # AND logic: both have "visual", only task-aa has "beginner"
+        ({"tags": ["beginner", "visual"]}, ["task-aa"]),
+        ({"trigger": "nonexistent"}, []),
+        ({}, _SHARED_ACTIVE),
+    ], ids=[
+        "trigger", "technique", "medium", "difficulty_range",
+        "difficulty_min_only", "difficulty_max_only", "tag", "shared_tag",
+        "tags_and_logic", "no_match", "no_filter_all_active",
+    ])
+    def test_filter(
+        self, shared_registry: TaskRegistry, criteria: dict,
+        expected_ids: list[str],
+    ) -> None:
+        results = shared_registry.query(**criteria)
+        assert [r.task_id for r in results] == expected_ids
 
 
 # ---------------------------------------------------------------------------
@@ -354,36 +358,21 @@ class TestQuerySingleCriterion:
 class TestQueryMultiCriteria:
     """TaskRegistry.query — combining multiple filter criteria."""
 
-    def test_trigger_and_technique(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01", {
-            "trigger": "urgency", "technique": "headline_manipulation",
-        })
-        _write_task(tmp_path, "task-02", {
-            "trigger": "urgency", "technique": "cherry_picking",
-        })
-        _write_task(tmp_path, "task-03", {
-            "trigger": "belonging", "technique": "headline_manipulation",
-        })
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        results = registry.query(trigger="urgency", technique="headline_manipulation")
-        assert len(results) == 1
-        assert results[0].task_id == "task-01"
-
-    def test_trigger_and_medium_and_difficulty(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01", {
-            "trigger": "urgency", "medium": "article", "difficulty": 2,
-        })
-        _write_task(tmp_path, "task-02", {
-            "trigger": "urgency", "medium": "article", "difficulty": 5,
-        })
-        registry = _make_registry(tmp_path)
-        registry.load()
+    def test_trigger_and_technique(self, shared_registry: TaskRegistry) -> None:
+        # belonging: mm, zz — headline_manipulation: aa, zz
+        results = shared_registry.query(
+            trigger="belonging", technique="headline_manipulation",
+        )
+        assert [r.task_id for r in results] == ["task-zz"]
 
-        results = registry.query(trigger="urgency", medium="article", difficulty_max=3)
-        assert len(results) == 1
-        assert results[0].task_id == "task-01"
+    def test_trigger_and_medium_and_difficulty(
+        self, shared_registry: TaskRegistry,
+    ) -> None:
+        # belonging: mm, zz — article: aa, mm — difficulty <= 3: aa, mm
+        results = shared_registry.query(
+            trigger="belonging", medium="article", difficulty_max=3,
+        )
+        assert [r.task_id for r in results] == ["task-mm"]
 
 
 # ---------------------------------------------------------------------------
@@ -394,57 +383,32 @@ class TestQueryMultiCriteria:
 class TestQueryStatus:
     """TaskRegistry.query — status partitioning."""
 
-    def test_default_returns_active_only(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-active")
-        _write_task(tmp_path, "task-draft", {"status": "draft"})
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        results = registry.query()
-        assert len(results) == 1
-        assert results[0].task_id == "task-active"
+    def test_default_returns_active_only(self, shared_registry: TaskRegistry) -> None:
+        results = shared_registry.query()
+        assert [r.task_id for r in results] == _SHARED_ACTIVE
 
-    def test_status_draft(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-active")
-        _write_task(tmp_path, "task-draft", {"status": "draft"})
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        results = registry.query(status="draft")
-        assert len(results) == 1
-        assert results[0].task_id == "task-draft"
+    def test_status_draft(self, shared_registry: TaskRegistry) -> None:
+        results = shared_registry.query(status="draft")
+        assert [r.task_id for r in results] == ["task-demoted", "task-draft"]
 
-    def test_status_deprecated(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-dep", {"status": "deprecated"})
-        registry = _make_registry(tmp_path)
-        registry.load()
+    def test_status_deprecated(self, shared_registry: TaskRegistry) -> None:
+        results = shared_registry.query(status="deprecated")
+        assert [r.task_id for r in results] == ["task-dep"]
 
-        results = registry.query(status="deprecated")
-        assert len(results) == 1
-        assert results[0].task_id == "task-dep"
+    def test_status_all(self, shared_registry: TaskRegistry) -> None:
+        results = shared_registry.query(status="all")
+        assert len(results) == len(_SHARED_TASKS)
 
-    def test_status_all(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-active")
-        _write_task(tmp_path, "task-draft", {"status": "draft"})
-        _write_task(tmp_path, "task-dep", {"status": "deprecated"})
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        results = registry.query(status="all")
-        assert len(results) == 3
-
-    def test_demoted_task_in_draft_partition(self, tmp_path: Path) -> None:
+    def test_demoted_task_in_draft_partition(
+        self, shared_registry: TaskRegistry,
+    ) -> None:
         # Task declared active but with is_evergreen=False triggers demotion
-        _write_task(tmp_path, "task-demoted", {"is_evergreen": False})
-        registry = _make_registry(tmp_path)
-        registry.load()
-
         # Not in active
-        active = registry.query(status="active")
+        active = shared_registry.query(status="active")
         assert all(r.task_id != "task-demoted" for r in active)
 
         # Should be in draft
-        drafts = registry.query(status="draft")
+        drafts = shared_registry.query(status="draft")
         assert any(r.task_id == "task-demoted" for r in drafts)
 
 
@@ -456,45 +420,24 @@ class TestQueryStatus:
 class TestQueryPagination:
     """TaskRegistry.query — limit/offset pagination."""
 
-    def test_limit(self, tmp_path: Path) -> None:
-        for i in range(5):
-            _write_task(tmp_path, f"task-{i:02d}")
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        results = registry.query(limit=2)
+    def test_limit(self, shared_registry: TaskRegistry) -> None:
+        results = shared_registry.query(limit=2)
         assert len(results) == 2
 
-    def test_offset(self, tmp_path: Path) -> None:
-        for i in range(5):
-            _write_task(tmp_path, f"task-{i:02d}")
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        all_results = registry.query(limit=50)
-        offset_results = registry.query(offset=2, limit=50)
+    def test_offset(self, shared_registry: TaskRegistry) -> None:
+        all_results = shared_registry.query(limit=50)
+        offset_results = shared_registry.query(offset=2, limit=50)
         assert offset_results == all_results[2:]
 
-    def test_limit_and_offset(self, tmp_path: Path) -> None:
-        for i in range(5):
-            _write_task(tmp_path, f"task-{i:02d}")
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        results = registry.query(offset=1, limit=2)
+    def test_limit_and_offset(self, shared_registry: TaskRegistry) -> None:
+        results = shared_registry.query(offset=1, limit=2)
         assert len(results) == 2
-        all_results = registry.query(limit=50)
+        all_results = shared_registry.query(limit=50)
         assert results == all_results[1:3]
 
-    def test_results_sorted_by_task_id(self, tmp_path: Path) -> None:
-        # Create in non-alphabetical order
-        _write_task(tmp_path, "task-zz")
-        _write_task(tmp_path, "task-aa")
-        _write_task(tmp_path, "task-mm")
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        results = registry.query()
+    def test_results_sorted_by_task_id(self, shared_registry: TaskRegistry) -> None:
+        # _SHARED_TASKS is listed in non-alphabetical order
+        results = shared_registry.query()
         ids = [r.task_id for r in results]
         assert ids == sorted(ids)
 
@@ -507,42 +450,22 @@ class TestQueryPagination:
 class TestTaskIdsMethods:
     """TaskRegistry.get_all_task_ids and count."""
 
-    def test_get_all_task_ids_active(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01")
-        _write_task(tmp_path, "task-02")
-        _write_task(tmp_path, "task-draft", {"status": "draft"})
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        ids = registry.get_all_task_ids()
-        assert ids == ["task-01", "task-02"]
-
-    def test_get_all_task_ids_all(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01")
-        _write_task(tmp_path, "task-draft", {"status": "draft"})
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        ids = registry.get_all_task_ids("all")
-        assert len(ids) == 2
-
-    def test_count(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01")
-        _write_task(tmp_path, "task-02")
-        registry = _make_registry(tmp_path)
-        registry.load()
+    def test_get_all_task_ids_active(self, shared_registry: TaskRegistry) -> None:
+        ids = shared_registry.get_all_task_ids()
+        assert ids == _SHARED_ACTIVE
 
-        assert registry.count() == 2
-        assert registry.count("draft") == 0
-        assert registry.count("all") == 2
+    def test_get_all_task_ids_all(self, shared_registry: TaskRegistry) -> None:
+        ids = shared_registry.get_all_task_ids("all")
+        assert len(ids) == len(_SHARED_TASKS)
 
-    def test_get_all_task_ids_sorted(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-zz")
-        _write_task(tmp_path, "task-aa")
-        registry = _make_registry(tmp_path)
-        registry.load()
+    def test_count(self, shared_registry: TaskRegistry) -> None:
+        assert shared_registry.count() == 3
+        assert shared_registry.count("draft") == 2
+        assert shared_registry.count("deprecated") == 1
+        assert shared_registry.count("all") == 6
 
-        ids = registry.get_all_task_ids()
+    def test_get_all_task_ids_sorted(self, shared_registry: TaskRegistry) -> None:
+        ids = shared_registry.get_all_task_ids("all")
         assert ids == sorted(ids)
 
 
@@ -554,20 +477,20 @@ class TestTaskIdsMethods:
 class TestReload:
     """TaskRegistry.reload — atomic index replacement."""
 
-    def test_reload_picks_up_new_task(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01")
-        registry = _make_registry(tmp_path)
+    def test_reload_picks_up_new_task(self, scratch: Path) -> None:
+        _write_task(scratch, "task-01")
+        registry = _make_registry(scratch)
         registry.load()
         assert registry.count() == 1
 
-        _write_task(tmp_path, "task-02")
+        _write_task(scratch, "task-02")
         registry.reload()
         assert registry.count() == 2
         assert registry.get_task("task-02") is not None
 
-    def test_reload_removes_deleted_task(self, tmp_path: Path) -> None:
-        td = _write_task(tmp_path, "task-01")
-        registry = _make_registry(tmp_path)
+    def test_reload_removes_deleted_task(self, scratch: Path) -> None:
+        td = _write_task(scratch, "task-01")
+        registry = _make_registry(scratch)
         registry.load()
         assert registry.count() == 1
 
@@ -578,36 +501,36 @@ class TestReload:
         assert registry.count() == 0
         assert registry.get_task("task-01") is None
 
-    def test_reload_picks_up_modified_task(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01", {"difficulty": 2})
-        registry = _make_registry(tmp_path)
+    def test_reload_picks_up_modified_task(self, scratch: Path) -> None:
+        # One cartridge dict, written twice with different difficulty
+        task_json = scratch / "tasks" / "task-01" / "task.json"
+        task_json.parent.mkdir(parents=True)
+        data = _minimal_cartridge("task-01")
+        data["difficulty"] = 2
+        task_json.write_bytes(dumps_json(data))
+        registry = _make_registry(scratch)
         registry.load()
         assert registry.get_task("task-01").difficulty == 2
 
         # Overwrite with new difficulty
-        task_dir = tmp_path / "tasks" / "task-01"
-        data = _minimal_cartridge("task-01")
         data["difficulty"] = 5
-        (task_dir / "task.json").write_text(
-            json.dumps(data, ensure_ascii=False), encoding="utf-8",
-        )
+        task_json.write_bytes(dumps_json(data))
         registry.reload()
         assert registry.get_task("task-01").difficulty == 5
 
-    def test_reload_re_reads_taxonomy(self, tmp_path: Path) -> None:
+    def test_reload_re_reads_taxonomy(self, scratch: Path) -> None:
         # Start with a known trigger
-        _write_task(tmp_path, "task-01", {"trigger": "urgency"})
-        registry = _make_registry(tmp_path)
+        _write_task(scratch, "task-01", {"trigger": "urgency"})
+        registry = _make_registry(scratch)
         registry.load()
         assert registry.count() == 1
 
         # Add new trigger to taxonomy and add a task using it
-        tax_path = tmp_path / "taxonomy.json"
-        new_tax = dict(TAXONOMY)
+        new_tax = {category: dict(values) for category, values in TAXONOMY.items()}
         new_tax["triggers"]["conspiracy"] = "Sąmokslas"
-        tax_path.write_text(json.dumps(new_tax), encoding="utf-8")
+        _write_taxonomy(scratch, new_tax)
 
-        _write_task(tmp_path, "task-02", {"trigger": "conspiracy"})
+        _write_task(scratch, "task-02", {"trigger": "conspiracy"})
         registry.reload()
         assert registry.count() == 2
         # No taxonomy warning for the new trigger
@@ -617,10 +540,11 @@ class TestReload:
                           for w in warnings["task-02"])
 
     def test_reload_preserves_old_index_on_total_failure(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+        self, scratch: Path, monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        _write_task(tmp_path, "task-01")
-        registry = _make_registry(tmp_path)
+        _write_task(scratch, "task-01")
+        loader = TaskLoader()
+        registry = _make_registry(scratch, loader)
         registry.load()
         assert registry.count() == 1
 
@@ -628,21 +552,21 @@ class TestReload:
         def _boom(*args, **kwargs):
             raise RuntimeError("Disk on fire")
 
-        monkeypatch.setattr(registry._loader, "load_taxonomy", _boom)
+        monkeypatch.setattr(loader, "load_taxonomy", _boom)
         registry.reload()
 
         # Old index preserved
         assert registry.count() == 1
         assert registry.get_task("task-01") is not None
 
-    def test_reload_with_broken_new_cartridge(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01")
-        registry = _make_registry(tmp_path)
+    def test_reload_with_broken_new_cartridge(self, scratch: Path) -> None:
+        _write_task(scratch, "task-01")
+        registry = _make_registry(scratch)
         registry.load()
         assert registry.count() == 1
 
         # Add a broken cartridge — should not blow up, just error
-        bad_dir = tmp_path / "tasks" / "task-bad"
+        bad_dir = scratch / "tasks" / "task-bad"
         bad_dir.mkdir(parents=True)
         (bad_dir / "task.json").write_text("nope", encoding="utf-8")
 
@@ -660,26 +584,15 @@ class TestReload:
 class TestIsPhaseValid:
     """TaskRegistry.is_phase_valid — stale phase detection for live sessions."""
 
-    def test_valid_phase(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01")
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        assert registry.is_phase_valid("task-01", "phase_intro") is True
-        assert registry.is_phase_valid("task-01", "phase_reveal") is True
+    def test_valid_phase(self, shared_registry: TaskRegistry) -> None:
+        assert shared_registry.is_phase_valid("task-aa", "phase_intro") is True
+        assert shared_registry.is_phase_valid("task-aa", "phase_reveal") is True
 
-    def test_invalid_phase(self, tmp_path: Path) -> None:
-        _write_task(tmp_path, "task-01")
-        registry = _make_registry(tmp_path)
-        registry.load()
-
-        assert registry.is_phase_valid("task-01", "nonexistent") is False
-
-    def test_nonexistent_task(self, tmp_path: Path) -> None:
-        registry = _make_registry(tmp_path)
-        registry.load()
+    def test_invalid_phase(self, shared_registry: TaskRegistry) -> None:
+        assert shared_registry.is_phase_valid("task-aa", "nonexistent") is False
 
-        assert registry.is_phase_valid("no-such-task", "any-phase") is False
+    def test_nonexistent_task(self, shared_registry: TaskRegistry) -> None:
+        assert shared_registry.is_phase_valid("no-such-task", "any-phase") is False
 
 
 # ---------------------------------------------------------------------------
@@ -691,12 +604,12 @@ class TestGetTaskRegistryDep:
     """get_task_registry dependency in deps.py."""
 
     def test_returns_registry_when_set(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+        self, scratch: Path, monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         from backend.api import deps
 
-        _write_task(tmp_path, "task-01")
-        registry = _make_registry(tmp_path)
+        _write_task(scratch, "task-01")
+        registry = _make_registry(scratch)
         registry.load()
 
         monkeypatch.setattr(deps, "_task_registry", registry)